@@ -0,0 +1,66 @@
+# install.py
+# One-off setup for the AEDT extension:
+# - resolves the Python interpreter and optimizer_gui.py paths
+# - writes them to paths.json in the per-user config folder
+#   (~/.aedt_optimizer/paths.json), where launch_optimizer_from_aedt.py
+#   finds it wherever the Extension Manager copied the launcher
+# - optionally also writes paths.json into a given extension folder:
+#       python install.py --extension-dir "<PersonalLib>/Toolkits/.../<extension>"
+#
+# Run it again whenever the files move or another interpreter should be used.
+
+import argparse
+import json
+from pathlib import Path
+
+# Must match USER_PATHS_FILE in launch_optimizer_from_aedt.py.
+USER_PATHS_FILE = Path.home() / ".aedt_optimizer" / "paths.json"
+
+# --- Configure paths (EDIT ONLY THESE TWO LINES IF NEEDED) ---
+
+PYTHON_EXE = r"C:\Program Files\ANSYS Inc\v252\commonfiles\CPython\3_10\winx64\Release\python\python.exe"
+GUI_SCRIPT = r"C:\Users\2948856C\Documents\AI-DAD\00_integration_GUI\optimizer_gui.py"
+# GUI_SCRIPT = str(Path(__file__).resolve().parent / "optimizer_gui.py")
+
+# PYTHON_EXE = r"C:\Users\2948856C\OneDrive - University of Glasgow\0_PHD\2_software_projects\2_pysadeaGUI\ai-dad-gui\sadeagui_env\Scripts\python.exe"
+# GUI_SCRIPT = r"C:\Users\2948856C\OneDrive - University of Glasgow\0_PHD\2_software_projects\9_AllGUI\ai-dad-gui\aide_gui_run.py"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write paths.json for the AEDT optimizer extension.")
+    parser.add_argument(
+        "--extension-dir",
+        help="Folder the launcher was installed to; paths.json is also written there.",
+    )
+    args = parser.parse_args()
+
+    python_exe = Path(PYTHON_EXE)
+    gui_script = Path(GUI_SCRIPT).resolve()
+
+    # Checked once here so the launcher does not have to on every click.
+    if not python_exe.exists():
+        raise FileNotFoundError(f"Python interpreter not found at: {python_exe}")
+    if not gui_script.exists():
+        raise FileNotFoundError(f"optimizer_gui.py not found at: {gui_script}")
+
+    paths = {
+        "python_exe": str(python_exe),
+        "gui_script": str(gui_script),
+    }
+
+    out_paths = [USER_PATHS_FILE]
+    if args.extension_dir:
+        out_paths.append(Path(args.extension_dir).resolve() / "paths.json")
+
+    for out_path in out_paths:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(paths, f, indent=2)
+        print("Wrote", out_path)
+
+    for key, value in paths.items():
+        print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
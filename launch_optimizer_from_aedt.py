@@ -3,10 +3,14 @@
 # - attaches to current AEDT session
 # - gets the active AEDT project path
 # - starts optimizer_gui.py and passes the path as an argument
+#
+# The interpreter and GUI script paths are read from paths.json, which
+# install.py writes. It is looked up next to this file first, then in the
+# per-user config folder (the Extension Manager may copy only this file).
 
 import os
+import json
 import subprocess
-from pathlib import Path
 import ansys.aedt.core  # PyAEDT
 
 # --- Attach to the running AEDT session ---
@@ -36,33 +40,82 @@ except Exception as e:
     log.info("Failed to get AEDT project path: %s", e)
     project_path = ""
 
-# --- Configure paths (EDIT ONLY THESE TWO LINES IF NEEDED) ---
-
-PYTHON_EXE = r"C:\Program Files\ANSYS Inc\v252\commonfiles\CPython\3_10\winx64\Release\python\python.exe"
-GUI_SCRIPT = r"C:\Users\2948856C\Documents\AI-DAD\00_integration_GUI\optimizer_gui.py"
-# GUI_SCRIPT = str(Path(__file__).resolve().parent / "optimizer_gui.py")
-
-# PYTHON_EXE = r"C:\Users\2948856C\OneDrive - University of Glasgow\0_PHD\2_software_projects\2_pysadeaGUI\ai-dad-gui\sadeagui_env\Scripts\python.exe"
-# GUI_SCRIPT = r"C:\Users\2948856C\OneDrive - University of Glasgow\0_PHD\2_software_projects\9_AllGUI\ai-dad-gui\aide_gui_run.py"
+# --- Load paths resolved at install time (run install.py to change them) ---
+# Must match USER_PATHS_FILE in install.py.
+USER_PATHS_FILE = os.path.join(os.path.expanduser("~"), ".aedt_optimizer", "paths.json")
 
+paths_file = os.path.join(os.path.dirname(__file__), "paths.json")
+if not os.path.isfile(paths_file):
+    paths_file = USER_PATHS_FILE
+try:
+    with open(paths_file, encoding="utf-8") as f:
+        cfg = json.load(f)
+    PYTHON_EXE = cfg["python_exe"]
+    GUI_SCRIPT = cfg["gui_script"]
+except (OSError, ValueError, KeyError, TypeError) as e:
+    log.info("Failed to read %s: %s", paths_file, e)
+    log.info("Run install.py to (re)create paths.json.")
+    desktop.release_desktop(False, False)
+    raise RuntimeError(
+        f"Failed to read {paths_file}: {e}\nRun install.py to (re)create paths.json."
+    ) from e
 
 # --- Check script exists ---
-gui_path = Path(GUI_SCRIPT)
-if not gui_path.exists():
-    log.info("optimizer_gui.py not found at: %s", gui_path)
-    raise FileNotFoundError(f"optimizer_gui.py not found at: {gui_path}")
+# A missing script does not fail the launch itself: python.exe starts, exits with
+# code 2, and its stderr is discarded. One cheap stat (no resolve()) catches it here.
+if not os.path.isfile(GUI_SCRIPT):
+    log.info("optimizer_gui.py not found at: %s (re-run install.py)", GUI_SCRIPT)
+    desktop.release_desktop(False, False)
+    raise FileNotFoundError(f"optimizer_gui.py not found at: {GUI_SCRIPT}")
+
+# Start a simulation as soon as the GUI opens (optimizer_gui.py --auto-start).
+AUTO_START = False
 
 # --- Build command to launch GUI and pass project_path ---
-cmd = [PYTHON_EXE, str(gui_path)]
+cmd = [PYTHON_EXE, GUI_SCRIPT]
 if project_path:
     cmd.append(project_path)  # argv[1] in optimizer_gui.py
+if AUTO_START:
+    cmd.append("--auto-start")
+
+# --- Detach from AEDT (don't close it) ---
+desktop.release_desktop(False, False)
+
+# --- Launch GUI ---
+# Nothing is left to do here once AEDT is released, so on POSIX replace this
+# interpreter with the GUI instead of starting a second Python process.
+# Windows' execv only emulates this (and does not quote arguments containing
+# spaces, e.g. "Program Files"), so Windows keeps the Popen path.
+if os.name != "nt" and hasattr(os, "execvp"):
+    log.info("Launching Optimizer GUI in place of the extension process")
+    try:
+        os.execvp(PYTHON_EXE, cmd)  # does not return on success
+    except OSError as e:
+        log.info("exec of Optimizer GUI failed, falling back to Popen: %s", e)
+
+# Start the GUI fully independent of AEDT: no inherited handles or console,
+# its own process group, and outside the extension runner's job object.
+flags = 0
+if os.name == "nt":
+    flags = (
+        subprocess.DETACHED_PROCESS
+        | subprocess.CREATE_NEW_PROCESS_GROUP
+        | subprocess.CREATE_BREAKAWAY_FROM_JOB
+    )
+popen_kwargs = dict(
+    close_fds=True,
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+)
 
-# --- Launch GUI (non-blocking) ---
 try:
-    p = subprocess.Popen(cmd)
+    try:
+        p = subprocess.Popen(cmd, creationflags=flags, **popen_kwargs)
+    except PermissionError:
+        # The job object does not allow breakaway; launch inside it instead.
+        flags &= ~getattr(subprocess, "CREATE_BREAKAWAY_FROM_JOB", 0)
+        p = subprocess.Popen(cmd, creationflags=flags, **popen_kwargs)
     log.info("SADEA_GUI launched, PID=%s", p.pid)
 except Exception as e:
     log.info("Failed to launch Optimizer GUI: %s", e)
-
-# --- Detach from AEDT (don't close it) ---
-desktop.release_desktop(False, False)
@@ -1,6 +1,12 @@
 import sys
 import os
+import argparse
 import random
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
 
 from PyQt5.QtWidgets import (
     QApplication,
@@ -15,8 +21,21 @@ from PyQt5.QtWidgets import (
     QLabel,
     QLineEdit,
 )
-from PyQt5.QtGui import QIntValidator
-from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal
+from PyQt5.QtGui import QIntValidator, QTextCursor
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
+
+
+# Log lines are buffered and written to the log widget at most this often (ms),
+# so bursts of worker output only trigger one relayout per tick.
+LOG_FLUSH_INTERVAL_MS = 100
+
+# Upper bound on lines kept in the log widget over a long session.
+LOG_MAX_BLOCKS = 2000
+
+# How often (ms) the simulation worker asks AEDT whether the solve is still running,
+# and how many failed queries in a row it tolerates before giving up on the status.
+SIM_STATUS_POLL_MS = 1000
+SIM_STATUS_MAX_FAILURES = 10
 
 
 # -------------------- Random parameter configuration --------------------
@@ -40,6 +59,93 @@ PARAMETER_SPECS = {
 }
 
 
+# -------------------- PyAEDT (lazy import) --------------------
+
+# PyAEDT is heavy to import, so it is loaded on first use and then reused by
+# every button click / worker instead of re-running the import statements.
+_PYAEDT = None
+_PYAEDT_LOCK = threading.Lock()  # the GUI prewarm thread and workers may race here
+
+
+def _load_pyaedt():
+    """Import the PyAEDT entry points once and return them as a namespace.
+    Raises ImportError if PyAEDT is not installed.
+    """
+    global _PYAEDT
+    with _PYAEDT_LOCK:
+        if _PYAEDT is None:
+            import ansys.aedt.core  # noqa: F401
+            from ansys.aedt.core import Desktop
+            from ansys.aedt.core.generic.design_types import get_pyaedt_app
+
+            _PYAEDT = SimpleNamespace(Desktop=Desktop, get_pyaedt_app=get_pyaedt_app)
+        return _PYAEDT
+
+
+# Attached PyAEDT Desktop sessions, keyed by (version, port). Attaching opens
+# a new gRPC channel, so sessions are reused across clicks and workers and
+# only released when the window closes.
+_DESKTOP_CACHE = {}
+_DESKTOP_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_desktop(pyaedt, version: str, port):
+    """Return a live Desktop attached to AEDT on `port`, reusing a cached one."""
+    key = (version, int(port))
+    with _DESKTOP_CACHE_LOCK:
+        desktop = _DESKTOP_CACHE.get(key)
+        if desktop is not None:
+            try:
+                alive = desktop.odesktop is not None
+            except Exception:
+                alive = False
+            if alive:
+                return desktop
+
+        desktop = pyaedt.Desktop(
+            version=version,
+            new_desktop=False,
+            port=int(port),
+        )
+        _DESKTOP_CACHE[key] = desktop
+        return desktop
+
+
+def pop_cached_desktops():
+    """Empty the Desktop cache and return the sessions that were in it."""
+    with _DESKTOP_CACHE_LOCK:
+        desktops = list(_DESKTOP_CACHE.values())
+        _DESKTOP_CACHE.clear()
+    return desktops
+
+
+# -------------------- HFSS helpers --------------------
+
+def apply_parameter_expressions_to_hfss(app, parameter_expressions: dict):
+    """
+    Apply a parameter dictionary to the active HFSS design.
+    """
+    if not app:
+        raise RuntimeError("PyAEDT app not available.")
+
+    design_var_names = set(app.variable_manager.design_variable_names or [])
+    missing = [name for name in parameter_expressions if name not in design_var_names]
+    if missing:
+        raise RuntimeError(
+            "These configured variables were not found in the active HFSS design:\n"
+            + "\n".join(missing)
+        )
+
+    for var_name, expression in parameter_expressions.items():
+        ok = app.variable_manager.set_variable(
+            name=var_name,
+            expression=expression,
+            overwrite=True,
+        )
+        if not ok:
+            raise RuntimeError(f"Failed to set variable '{var_name}' to '{expression}'.")
+
+
 # -------------------- Popup dialogs --------------------
 
 class MetadataDialog(QDialog):
@@ -99,8 +205,7 @@ class MetadataFetchWorker(QObject):
         - Outputs: report names (ReportSetup.GetAllReportNames)
         """
         try:
-            from ansys.aedt.core import Desktop
-            from ansys.aedt.core.generic.design_types import get_pyaedt_app
+            pyaedt = _load_pyaedt()
         except Exception as e:
             self.error.emit(f"PyAEDT import failed: {e}")
             return
@@ -112,14 +217,9 @@ class MetadataFetchWorker(QObject):
             )
             return
 
-        desktop = None
         try:
-            desktop = Desktop(
-                version=self.version,
-                new_desktop=False,
-                port=int(self.port),
-            )
-            app = get_pyaedt_app(desktop=desktop)
+            desktop = get_cached_desktop(pyaedt, self.version, self.port)
+            app = pyaedt.get_pyaedt_app(desktop=desktop)
 
             payload = {
                 "variables": [],     # local design variables only
@@ -144,18 +244,212 @@ class MetadataFetchWorker(QObject):
         except Exception as e:
             self.error.emit(f"Failed to fetch metadata: {e}")
 
+
+# -------------------- Worker (threaded HFSS simulation) --------------------
+
+class SimulationWorker(QObject):
+    log_line = pyqtSignal(str)
+    solving = pyqtSignal(str)       # setup/sweep name, emitted right before analyze()
+    solve_status = pyqtSignal(object)   # True/False = AEDT still solving, None = unknown
+    finished = pyqtSignal(str, object)  # S(1,1) summary text, (freqs, s11) arrays
+    failed = pyqtSignal(str)
+
+    def __init__(self, port: str, version: str, parameter_expressions: dict, seed=None, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self.version = version
+        self.parameter_expressions = parameter_expressions
+        self.seed = seed
+        self.desktop = None  # cached Desktop, only used from the worker thread
+        self.app = None  # PyAEDT app, owned by the worker thread
+
+        # Complex S(1,1) of the last successful read, with its frequency axis.
+        self.freqs = None
+        self.s11 = None
+
+    def run(self):
+        """Attach to AEDT, re-apply the last parameter set, solve and read S(1,1).
+        Runs in a QThread, so all GUI updates go through signals.
+        """
+        try:
+            pyaedt = _load_pyaedt()
+        except Exception as e:
+            # Not only ImportError: anything escaping run() would leave the
+            # thread running and the buttons disabled.
+            self.log_line.emit(f"ERROR: PyAEDT import failed: {e}")
+            self.failed.emit(f"PyAEDT import failed: {e}")
+            return
+
+        if not self.port:
+            self.log_line.emit("ERROR: PYAEDT_SCRIPT_PORT not found in environment.")
+            self.failed.emit(
+                "PYAEDT_SCRIPT_PORT not found in environment.\n"
+                "This GUI must be launched from the AEDT PyAEDT Extension button."
+            )
+            return
+
+        try:
+            self.log_line.emit(f"Connecting to AEDT on gRPC port {self.port} (version={self.version})...")
+            try:
+                self.desktop = get_cached_desktop(pyaedt, self.version, self.port)
+                self.app = pyaedt.get_pyaedt_app(desktop=self.desktop)
+            except Exception as e:
+                self.log_line.emit(f"ERROR: Failed to attach to AEDT: {e}")
+                self.log_line.emit("Aborting simulation because connection failed.")
+                self.failed.emit("Failed to connect to AEDT.\nCheck the log for details.")
+                return
+
+            self.log_line.emit(
+                f"Connected to project '{self.app.project_name}', "
+                f"design '{self.app.design_name}'."
+            )
+
+            # Re-apply the last parameter set so the solve always uses
+            # the parameters most recently sent from the GUI.
+            if self.seed is not None:
+                self.log_line.emit(
+                    f"Re-applying the last parameter set before simulation (seed={self.seed})..."
+                )
+            else:
+                self.log_line.emit("Re-applying the last parameter set before simulation...")
+
+            apply_parameter_expressions_to_hfss(self.app, self.parameter_expressions)
+
+            summary, error_message = self.run_hfss_simulation_and_get_s11_summary()
+
+            if summary:
+                self.finished.emit(summary, (self.freqs, self.s11))
+            else:
+                self.failed.emit(error_message or "Simulation failed. Check the log for details.")
+
+        except Exception as e:
+            self.log_line.emit(f"ERROR during simulation flow: {e}")
+            self.failed.emit(str(e))
+
         finally:
-            if desktop:
-                try:
-                    desktop.release_desktop(close_projects=False, close_on_exit=False)
-                except Exception:
-                    pass
+            # The Desktop stays in the module-level cache for the next run;
+            # it is released when the window closes.
+            self.desktop = None
+            self.app = None
+
+    def _wait_for_solve(self):
+        """Poll AEDT until no simulation is running, reporting each answer via solve_status."""
+        failures = 0
+        while True:
+            try:
+                running = bool(self.desktop.are_there_simulations_running)
+                failures = 0
+            except Exception as e:
+                running = None
+                failures += 1
+                if failures >= SIM_STATUS_MAX_FAILURES:
+                    self.log_line.emit(f"WARNING: Lost solve status from AEDT, reading results anyway: {e}")
+                    return
+            self.solve_status.emit(running)
+            if running is False:
+                return
+            time.sleep(SIM_STATUS_POLL_MS / 1000)
+
+    def run_hfss_simulation_and_get_s11_summary(self):
+        """
+        Run HFSS and try to read S(1,1).
+        Returns:
+            (summary_text, error_text)
+        Exactly one of them is usually None.
+        """
+        if not self.app:
+            return None, "PyAEDT app is not available."
+
+        try:
+            self.log_line.emit("Starting HFSS simulation via app.analyze()...")
+            self.solving.emit(str(self.app.nominal_sweep or ""))
+            # Non-blocking, so this thread can report progress while AEDT solves.
+            # Every Desktop call (analyze, status poll, results) stays on this one
+            # thread; nothing touches the Desktop concurrently.
+            ok = self.app.analyze(blocking=False)
+            self.log_line.emit(f"HFSS analyze() returned: {ok}")
+            if ok:
+                self._wait_for_solve()
+
+            # Protection 1:
+            # If solve failed, stop here instead of trying to read solution data.
+            if not ok:
+                self.log_line.emit("WARNING: HFSS solve failed or no valid solution was produced.")
+                return None, (
+                    "HFSS simulation failed or no valid solution was produced.\n"
+                    "Please try another seed and check the AEDT Message Manager."
+                )
+
+        except Exception as e:
+            self.log_line.emit(f"ERROR during analyze(): {e}")
+            return None, f"HFSS simulation failed during analyze().\n{e}"
+
+        try:
+            self.log_line.emit("Retrieving dB(S(1,1)) solution data...")
+
+            # One gRPC round-trip; every expression/formula read below uses this object.
+            setup_sweep = self.app.nominal_sweep
+            data = self.app.post.get_solution_data(
+                expressions="S(1,1)",
+                setup_sweep_name=setup_sweep,
+            )
+
+            # Protection 2:
+            # get_solution_data may return False/None or another invalid object.
+            if not data or not hasattr(data, "get_expression_data"):
+                self.log_line.emit("WARNING: No valid solution-data object was returned.")
+                return None, (
+                    "HFSS simulation completed, but no valid S(1,1) solution data was returned.\n"
+                    "Please try another seed and check the AEDT Message Manager."
+                )
+
+            # Read the raw complex S(1,1) once; every derived quantity
+            # (dB, magnitude, phase, ...) is computed locally from it.
+            freqs, s11_re = data.get_expression_data(expression="S(1,1)", formula="real")
+            _, s11_im = data.get_expression_data(expression="S(1,1)", formula="imag")
+            freqs = np.asarray(freqs, dtype=np.float64)
+            s11 = np.asarray(s11_re, dtype=np.float64) + 1j * np.asarray(s11_im, dtype=np.float64)
+            with np.errstate(divide="ignore"):
+                s11_db = 20.0 * np.log10(np.abs(s11))
+
+            self.freqs = freqs
+            self.s11 = s11
+
+            n = freqs.size
+            if n == 0:
+                self.log_line.emit("No data points returned from get_expression_data().")
+                return None, (
+                    "HFSS simulation completed, but S(1,1) returned no data points.\n"
+                    "Please try another seed and check the AEDT Message Manager."
+                )
+
+            idx_min = int(np.argmin(s11_db))
+            f_res = freqs[idx_min]
+            s11_min = s11_db[idx_min]
+
+            first_points = "\n".join(
+                f"{i}: Freq = {f}, dB(S11) = {d}"
+                for i, (f, d) in enumerate(zip(freqs[:5], s11_db[:5]))
+            )
+            summary = (
+                f"Retrieved {n} points of dB(S(1,1)).\n"
+                f"Minimum: dB(S11) = {s11_min} at Freq = {f_res}\n"
+                f"First few points:\n{first_points}"
+            )
+            return summary, None
+
+        except Exception as e:
+            self.log_line.emit(f"ERROR retrieving solution data: {e}")
+            return None, (
+                "HFSS simulation finished, but reading S(1,1) failed.\n"
+                f"{e}"
+            )
 
 
 # -------------------- Main window --------------------
 
 class MainWindow(QWidget):
-    def __init__(self, project_path=None, parent=None):
+    def __init__(self, project_path=None, auto_start=False, parent=None):
         super().__init__(parent)
         self.project_path = project_path
         self.desktop = None
@@ -164,14 +458,33 @@ class MainWindow(QWidget):
         # thread handles (keep refs)
         self._meta_thread = None
         self._meta_worker = None
+        self._sim_thread = None
+        self._sim_worker = None
+        self._sim_setup = ""
+        self._sim_started_at = None
+        self._sim_running = None      # last solve_status reported by the current worker
 
         # Stores the last parameter set that was successfully applied through the GUI.
         # Format: {var_name: "value_with_unit"}
         self.applied_parameters = None
         self.last_applied_seed = None
 
+        # Complex S(1,1) of the last successful simulation: (freqs, s11) arrays.
+        # Kept so cost functions can be evaluated without another AEDT read.
+        self.last_s11 = None
+
+        # PyAEDT modules, filled in by the background prewarm thread.
+        self._pyaedt_mods = None
+
         self.init_ui()
 
+        # Import PyAEDT while the user is still choosing a seed, so the first
+        # click does not wait for it. Imports only: no Desktop() is created here.
+        threading.Thread(target=self._prewarm_pyaedt, daemon=True).start()
+
+        if auto_start:
+            QTimer.singleShot(0, self._auto_start_simulation)
+
     # ---------- GUI setup ----------
 
     def init_ui(self):
@@ -207,10 +520,24 @@ class MainWindow(QWidget):
         self.fetch_meta_btn.clicked.connect(self.fetch_metadata)
         layout.addWidget(self.fetch_meta_btn)
 
+        self.status_label = QLabel("Idle.")
+        layout.addWidget(self.status_label)
+
+        self._sim_status_timer = QTimer(self)
+        self._sim_status_timer.setInterval(SIM_STATUS_POLL_MS)
+        self._sim_status_timer.timeout.connect(self._update_simulation_status)
+
         self.log = QTextEdit()
         self.log.setReadOnly(True)
+        self.log.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         layout.addWidget(self.log)
 
+        self._log_buf: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
         self.setLayout(layout)
 
         self.append_log("Optimizer GUI started.")
@@ -218,19 +545,85 @@ class MainWindow(QWidget):
             self.append_log(f"Received AEDT project path: {self.project_path}")
 
     def append_log(self, text: str):
-        self.log.append(text)
+        self._log_buf.append(text)
+
+    def _flush_log(self):
+        """Write all buffered log lines to the widget in a single insert.
+        Inserted as plain text: QTextEdit.append() would guess rich text from the
+        first line only and could render the whole batch as HTML.
+        """
+        if not self._log_buf:
+            return
+
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        if not self.log.document().isEmpty():
+            text = "\n" + text
+
+        scrollbar = self.log.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        cursor = QTextCursor(self.log.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _set_aedt_buttons_enabled(self, enabled: bool):
+        """Enable/disable every button that drives AEDT.
+        Only one AEDT operation may run at a time, since they share one Desktop.
+        """
+        self.apply_params_btn.setEnabled(enabled)
+        self.start_btn.setEnabled(enabled)
+        self.fetch_meta_btn.setEnabled(enabled)
+
+    def _worker_active(self) -> bool:
+        """True while a simulation or metadata worker thread is still running."""
+        return self._sim_thread is not None or self._meta_thread is not None
+
+    def closeEvent(self, event):
+        # analyze() cannot be interrupted, and Qt aborts if a running QThread is
+        # destroyed at interpreter teardown, so refuse to close until it is done.
+        if self._worker_active():
+            QMessageBox.information(
+                self,
+                "Operation In Progress",
+                "AEDT is still busy (simulation or metadata fetch).\n"
+                "Please wait for it to finish before closing the window."
+            )
+            event.ignore()
+            return
+
+        self._sim_status_timer.stop()
+        self._release_aedt_connection()
+        self._log_timer.stop()
+        self._flush_log()
+        super().closeEvent(event)
 
     # ---------- AEDT / PyAEDT helpers (existing) ----------
 
+    def _prewarm_pyaedt(self):
+        """Background thread: load PyAEDT into sys.modules ahead of first use."""
+        try:
+            self._pyaedt_mods = _load_pyaedt()
+        except Exception:
+            # Any import failure (not only ImportError) is left for the first
+            # click: _PYAEDT stays unset, so the import is retried there and the
+            # error is reported by connect_to_open_aedt() or the workers.
+            pass
+
     def connect_to_open_aedt(self):
         """Attach to the currently open AEDT session using PyAEDT."""
         try:
-            from ansys.aedt.core import Desktop
-            from ansys.aedt.core.generic.design_types import get_pyaedt_app
+            pyaedt = self._pyaedt_mods or _load_pyaedt()
         except ImportError as e:
             self.append_log("ERROR: PyAEDT is not installed in this Python environment.")
             self.append_log(str(e))
             return False
+        except Exception as e:
+            self.append_log(f"ERROR: PyAEDT import failed: {e}")
+            return False
 
         port = os.environ.get("PYAEDT_SCRIPT_PORT")
         version = os.environ.get("PYAEDT_SCRIPT_VERSION", "2025.2")
@@ -243,13 +636,9 @@ class MainWindow(QWidget):
         self.append_log(f"Connecting to AEDT on gRPC port {port} (version={version})...")
 
         try:
-            self.desktop = Desktop(
-                version=version,
-                new_desktop=False,
-                port=int(port),
-            )
+            self.desktop = get_cached_desktop(pyaedt, version, port)
 
-            self.app = get_pyaedt_app(desktop=self.desktop)
+            self.app = pyaedt.get_pyaedt_app(desktop=self.desktop)
 
             self.append_log(
                 f"Connected to project '{self.app.project_name}', "
@@ -264,10 +653,16 @@ class MainWindow(QWidget):
             return False
 
     def _release_aedt_connection(self):
-        """Release the current PyAEDT desktop connection cleanly."""
-        if self.desktop:
+        """Release all cached PyAEDT desktop connections cleanly.
+        Does nothing while a worker may still be using one of them.
+        """
+        if self._worker_active():
+            self.append_log("WARNING: AEDT is still busy; keeping the Desktop connection.")
+            return
+
+        for desktop in pop_cached_desktops():
             try:
-                self.desktop.release_desktop(close_projects=False, close_on_exit=False)
+                desktop.release_desktop(close_projects=False, close_on_exit=False)
                 self.append_log("Released PyAEDT Desktop connection.")
             except Exception as e:
                 self.append_log(f"WARNING: Failed to release Desktop cleanly: {e}")
@@ -303,30 +698,6 @@ class MainWindow(QWidget):
 
         return generated
 
-    def _apply_parameter_expressions_to_hfss(self, parameter_expressions: dict):
-        """
-        Apply a parameter dictionary to the active HFSS design.
-        """
-        if not self.app:
-            raise RuntimeError("PyAEDT app not available.")
-
-        design_var_names = set(self.app.variable_manager.design_variable_names or [])
-        missing = [name for name in parameter_expressions if name not in design_var_names]
-        if missing:
-            raise RuntimeError(
-                "These configured variables were not found in the active HFSS design:\n"
-                + "\n".join(missing)
-            )
-
-        for var_name, expression in parameter_expressions.items():
-            ok = self.app.variable_manager.set_variable(
-                name=var_name,
-                expression=expression,
-                overwrite=True,
-            )
-            if not ok:
-                raise RuntimeError(f"Failed to set variable '{var_name}' to '{expression}'.")
-
     def _format_parameters_for_popup(self, parameter_expressions: dict, seed: int) -> str:
         lines = [
             "Applied random parameter set",
@@ -360,7 +731,7 @@ class MainWindow(QWidget):
             parameter_expressions = self._generate_random_parameter_expressions(seed)
 
             self.append_log(f"Applying parameter set generated from seed {seed}...")
-            self._apply_parameter_expressions_to_hfss(parameter_expressions)
+            apply_parameter_expressions_to_hfss(self.app, parameter_expressions)
 
             self.applied_parameters = parameter_expressions
             self.last_applied_seed = seed
@@ -379,133 +750,127 @@ class MainWindow(QWidget):
             QMessageBox.critical(self, "Parameter Update Failed", str(e))
 
         finally:
-            self._release_aedt_connection()
+            # Keep the cached Desktop for the next click; released in closeEvent().
             self.apply_params_btn.setEnabled(True)
 
-    def run_hfss_simulation_and_get_s11_summary(self):
-        """
-        Run HFSS and try to read S(1,1).
-        Returns:
-            (summary_text, error_text)
-        Exactly one of them is usually None.
-        """
-        if not self.app:
-            return None, "PyAEDT app is not available."
-
-        try:
-            self.append_log("Starting HFSS simulation via app.analyze()...")
-            ok = self.app.analyze()
-            self.append_log(f"HFSS analyze() returned: {ok}")
-
-            # Protection 1:
-            # If solve failed, stop here instead of trying to read solution data.
-            if not ok:
-                self.append_log("WARNING: HFSS solve failed or no valid solution was produced.")
-                return None, (
-                    "HFSS simulation failed or no valid solution was produced.\n"
-                    "Please try another seed and check the AEDT Message Manager."
-                )
-
-        except Exception as e:
-            self.append_log(f"ERROR during analyze(): {e}")
-            return None, f"HFSS simulation failed during analyze().\n{e}"
-
-        try:
-            self.append_log("Retrieving dB(S(1,1)) solution data...")
-
-            setup_sweep = self.app.nominal_sweep
-            data = self.app.post.get_solution_data(
-                expressions="S(1,1)",
-                setup_sweep_name=setup_sweep,
-            )
-
-            # Protection 2:
-            # get_solution_data may return False/None or another invalid object.
-            if not data or not hasattr(data, "get_expression_data"):
-                self.append_log("WARNING: No valid solution-data object was returned.")
-                return None, (
-                    "HFSS simulation completed, but no valid S(1,1) solution data was returned.\n"
-                    "Please try another seed and check the AEDT Message Manager."
-                )
-
-            freqs, s11_db = data.get_expression_data(
-                expression="S(1,1)",
-                formula="db20",
-            )
-
-            n = len(freqs)
-            if n == 0:
-                self.append_log("No data points returned from get_expression_data().")
-                return None, (
-                    "HFSS simulation completed, but S(1,1) returned no data points.\n"
-                    "Please try another seed and check the AEDT Message Manager."
-                )
-
-            lines = [f"Retrieved {n} points of dB(S(1,1)) (showing first few):"]
-            max_to_show = min(5, n)
-            for i in range(max_to_show):
-                lines.append(f"{i}: Freq = {freqs[i]}, dB(S11) = {s11_db[i]}")
-            return "\n".join(lines), None
-
-        except Exception as e:
-            self.append_log(f"ERROR retrieving solution data: {e}")
-            return None, (
-                "HFSS simulation finished, but reading S(1,1) failed.\n"
-                f"{e}"
-            )
-
     # ---------- Simulation entry ----------
 
-    def run_simulation(self):
-        self.start_btn.setEnabled(False)
-        try:
-            if not self.applied_parameters:
-                QMessageBox.warning(
-                    self,
-                    "No Parameters Applied",
-                    "Please click 'Apply Parameters' first."
-                )
-                return
-
-            self.append_log("Attempting to connect to open AEDT session...")
-            if not self.connect_to_open_aedt():
-                self.append_log("Aborting simulation because connection failed.")
-                QMessageBox.critical(
-                    self,
-                    "Simulation Failed",
-                    "Failed to connect to AEDT.\nCheck the log for details."
-                )
+    def _auto_start_simulation(self):
+        """--auto-start: solve with the parameters generated from the seed field."""
+        if not self.applied_parameters:
+            try:
+                seed = self._get_seed_value()
+            except ValueError as e:
+                self.append_log(f"ERROR: Auto-start aborted: {e}")
                 return
+            # run_simulation() re-applies these to HFSS before solving.
+            self.applied_parameters = self._generate_random_parameter_expressions(seed)
+            self.last_applied_seed = seed
+            self.append_log(f"Auto-start: using parameter set generated from seed {seed}.")
+        self.run_simulation()
 
-            # Re-apply the last parameter set so the solve always uses
-            # the parameters most recently sent from the GUI.
-            if self.last_applied_seed is not None:
-                self.append_log(
-                    f"Re-applying the last parameter set before simulation (seed={self.last_applied_seed})..."
-                )
-            else:
-                self.append_log("Re-applying the last parameter set before simulation...")
+    def run_simulation(self):
+        if not self.applied_parameters:
+            QMessageBox.warning(
+                self,
+                "No Parameters Applied",
+                "Please click 'Apply Parameters' first."
+            )
+            return
 
-            self._apply_parameter_expressions_to_hfss(self.applied_parameters)
+        port = os.environ.get("PYAEDT_SCRIPT_PORT")
+        version = os.environ.get("PYAEDT_SCRIPT_VERSION", "2025.2")
 
-            summary, error_message = self.run_hfss_simulation_and_get_s11_summary()
+        # Validate the port before disabling anything; a missing port is
+        # reported by the worker itself.
+        try:
+            if port:
+                int(port)
+        except ValueError:
+            self.append_log(f"ERROR: Invalid PYAEDT_SCRIPT_PORT: {port!r}")
+            QMessageBox.critical(
+                self,
+                "Simulation Failed",
+                f"Invalid PYAEDT_SCRIPT_PORT: {port!r}\nCheck the log for details."
+            )
+            return
 
-            if summary:
-                QMessageBox.information(self, "Simulation Result", summary)
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Simulation Failed",
-                    error_message or "Simulation failed. Check the log for details."
-                )
+        self._set_aedt_buttons_enabled(False)
+        self.append_log("Attempting to connect to open AEDT session...")
+        self.status_label.setText("Connecting to AEDT...")
+
+        self._sim_thread = QThread()
+        self._sim_worker = SimulationWorker(
+            port=port,
+            version=version,
+            parameter_expressions=dict(self.applied_parameters),
+            seed=self.last_applied_seed,
+        )
+        self._sim_worker.moveToThread(self._sim_thread)
+
+        self._sim_thread.started.connect(self._sim_worker.run)
+        self._sim_worker.log_line.connect(self.append_log)
+        self._sim_worker.solving.connect(self._on_sim_solving)
+        self._sim_worker.solve_status.connect(self._on_sim_status)
+        self._sim_worker.finished.connect(self._on_sim_done)
+        self._sim_worker.failed.connect(self._on_sim_error)
 
-        except Exception as e:
-            self.append_log(f"ERROR during simulation flow: {e}")
-            QMessageBox.critical(self, "Simulation Failed", str(e))
+        # cleanup
+        self._sim_worker.finished.connect(self._sim_thread.quit)
+        self._sim_worker.failed.connect(self._sim_thread.quit)
+        self._sim_worker.finished.connect(self._sim_worker.deleteLater)
+        self._sim_worker.failed.connect(self._sim_worker.deleteLater)
+        self._sim_thread.finished.connect(self._sim_thread.deleteLater)
+        self._sim_thread.finished.connect(self._on_sim_thread_finished)
+
+        self._sim_thread.start()
+
+    def _on_sim_solving(self, setup: str):
+        self._sim_setup = setup
+        self._sim_started_at = time.monotonic()
+        self._sim_running = None
+        self._update_simulation_status()
+        self._sim_status_timer.start()
+
+    def _on_sim_status(self, running):
+        self._sim_running = running
+        self._update_simulation_status()
+
+    def _update_simulation_status(self):
+        """Timer slot: refresh the status label from the worker's last solve_status.
+        No AEDT call is made here; the worker does the polling.
+        """
+        if self._sim_started_at is None:
+            return
 
-        finally:
-            self._release_aedt_connection()
-            self.start_btn.setEnabled(True)
+        elapsed = int(time.monotonic() - self._sim_started_at)
+        setup = f" '{self._sim_setup}'" if self._sim_setup else ""
+        if self._sim_running is False:
+            self.status_label.setText(f"Solve finished{setup}, reading results... ({elapsed} s elapsed)")
+        else:
+            self.status_label.setText(f"Solving{setup}... ({elapsed} s elapsed)")
+
+    def _stop_simulation_status(self, text: str):
+        self._sim_status_timer.stop()
+        self._sim_started_at = None
+        self._sim_running = None
+        self.status_label.setText(text)
+
+    def _on_sim_done(self, summary: str, s11_data):
+        self._stop_simulation_status("Simulation finished.")
+        self.last_s11 = s11_data
+        self._set_aedt_buttons_enabled(True)
+        QMessageBox.information(self, "Simulation Result", summary)
+
+    def _on_sim_error(self, msg: str):
+        self._stop_simulation_status("Simulation failed.")
+        self._set_aedt_buttons_enabled(True)
+        QMessageBox.warning(self, "Simulation Failed", msg)
+
+    def _on_sim_thread_finished(self):
+        # The QThread and worker are deleteLater()'d; drop the Python refs too.
+        self._sim_thread = None
+        self._sim_worker = None
 
     # ---------- Fetch Metadata ----------
 
@@ -513,7 +878,7 @@ class MainWindow(QWidget):
         port = os.environ.get("PYAEDT_SCRIPT_PORT")
         version = os.environ.get("PYAEDT_SCRIPT_VERSION", "2025.2")
 
-        self.fetch_meta_btn.setEnabled(False)
+        self._set_aedt_buttons_enabled(False)
         self.append_log("Fetching metadata from AEDT...")
 
         self._meta_thread = QThread()
@@ -530,16 +895,21 @@ class MainWindow(QWidget):
         self._meta_worker.finished.connect(self._meta_worker.deleteLater)
         self._meta_worker.error.connect(self._meta_worker.deleteLater)
         self._meta_thread.finished.connect(self._meta_thread.deleteLater)
+        self._meta_thread.finished.connect(self._on_meta_thread_finished)
 
         self._meta_thread.start()
 
+    def _on_meta_thread_finished(self):
+        self._meta_thread = None
+        self._meta_worker = None
+
     def _on_metadata_error(self, msg: str):
-        self.fetch_meta_btn.setEnabled(True)
+        self._set_aedt_buttons_enabled(True)
         self.append_log(f"Metadata fetch failed: {msg}")
         QMessageBox.critical(self, "Fetch Metadata Failed", msg)
 
     def _on_metadata_ready(self, payload: dict):
-        self.fetch_meta_btn.setEnabled(True)
+        self._set_aedt_buttons_enabled(True)
         self.append_log("Metadata fetch completed.")
 
         design_vars = payload.get("variables", []) or []
@@ -560,13 +930,21 @@ class MainWindow(QWidget):
 
 
 def main():
-    project_path = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = argparse.ArgumentParser(description="Optimizer GUI for the open AEDT session.")
+    parser.add_argument("project_path", nargs="?", help="Active AEDT project path.")
+    parser.add_argument(
+        "--auto-start",
+        action="store_true",
+        help="Start a simulation as soon as the window opens.",
+    )
+    args = parser.parse_args()
+    project_path = args.project_path
 
     if project_path:
         print("Received AEDT project path:", project_path)
 
-    app = QApplication(sys.argv)
-    win = MainWindow(project_path=project_path)
+    app = QApplication.instance() or QApplication(sys.argv)
+    win = MainWindow(project_path=project_path, auto_start=args.auto_start)
     win.show()
     sys.exit(app.exec_())
 